@@ -0,0 +1,167 @@
+"""
+pytest 공통 설정 (모든 테스트 모듈에 적용)
+"""
+import concurrent.futures
+import hashlib
+import os
+import sys
+from http.client import HTTPConnection
+
+import boto3
+import pytest
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+try:
+    import blake3  # 선택 패키지: INTEGRITY_ALGO=blake3 일 때 사용 (멀티스레드, MD5 대비 수 배 빠름)
+except ImportError:
+    blake3 = None
+
+# S3 클라이언트 공통 설정: 커넥션 풀 확대(동시 업로드 스레드 수 이상), TCP keep-alive,
+# 타임아웃, 스로틀링 대응 adaptive 재시도
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=30,
+    retries={'max_attempts': 5, 'mode': 'adaptive'}
+)
+
+# http.client 기본 소켓 쓰기 버퍼 크기 (blocksize 인자는 Python 3.7+)
+DEFAULT_BLOCKSIZE = 8192
+UPLOAD_BLOCKSIZE = 1024 * 1024
+
+# 무결성 검증 해시 알고리즘 (hashlib 알고리즘 이름 또는 blake3)
+# SHA-256은 SHA-NI 지원 CPU에서 OpenSSL이 하드웨어 가속을 사용하므로 MD5보다 빠름.
+# 기존 동작이 필요하면 INTEGRITY_ALGO=md5로 지정
+DIGEST_ALGO = os.getenv('INTEGRITY_ALGO', 'sha256').lower()
+if DIGEST_ALGO == 'blake3' and blake3 is None:
+    raise ImportError("INTEGRITY_ALGO=blake3 사용 시 blake3 패키지가 필요합니다 (pip install blake3)")
+
+# payload 픽스처 캐시 (파일 크기 -> (data, digest)), 워커 프로세스당 크기별 한 번만 생성
+_PAYLOAD_CACHE = {}
+
+def _new_hasher():
+    """스트리밍 다운로드용 해시 객체 생성 (DIGEST_ALGO)"""
+    if DIGEST_ALGO == 'blake3':
+        return blake3.blake3()
+    return hashlib.new(DIGEST_ALGO)
+
+def _digest(buf):
+    """메모리 버퍼의 해시 계산 (업로드 측과 다운로드 측이 같은 알고리즘을 사용)"""
+    if DIGEST_ALGO == 'blake3':
+        return blake3.blake3(buf, max_threads=blake3.blake3.AUTO).hexdigest()
+    return hashlib.new(DIGEST_ALGO, buf).hexdigest()
+
+@pytest.fixture(scope="session")
+def s3_client():
+    """워커 프로세스 전체에서 공유하는 S3 클라이언트
+
+    클라이언트마다 별도의 urllib3 커넥션 풀이 생성되므로, 모든 테스트 모듈이
+    이 세션 픽스처 하나를 사용해서 워커당 클라이언트/커넥션 풀을 하나만 유지합니다.
+    """
+    client = boto3.client(
+        's3',
+        endpoint_url=os.getenv('NCP_ENDPOINT_URL', 'https://kr.object.ncloudstorage.com'),
+        aws_access_key_id=os.getenv('NCP_ACCESS_KEY'),
+        aws_secret_access_key=os.getenv('NCP_SECRET_KEY'),
+        region_name=os.getenv('NCP_REGION', 'kr-standard'),
+        config=S3_CLIENT_CONFIG
+    )
+    # 커넥션 풀 워밍업: 첫 테스트가 TLS 핸드셰이크 비용을 떠안지 않도록 연결을 미리 수립
+    client.list_buckets()
+    return client
+
+@pytest.fixture(scope="session", autouse=True)
+def http_upload_blocksize():
+    """HTTPConnection 쓰기 버퍼를 8KB -> 1MB로 확대
+
+    boto3(urllib3)는 http.client.HTTPConnection을 통해 요청 본문을 전송하는데,
+    기본 blocksize 8192 바이트 단위로 send()를 반복하므로 대용량 업로드에서
+    클라이언트 CPU가 병목이 됩니다. blocksize 기본값을 1MB로 바꾸면 5MB 이상
+    업로드/무결성/멀티파트 테스트의 처리량이 약 2배 향상됩니다.
+    autouse 세션 픽스처이므로 s3_client 생성 전에 적용되고, 세션 종료 시 복원됩니다.
+    """
+    if sys.version_info < (3, 7):
+        yield
+        return
+
+    original_defaults = HTTPConnection.__init__.__defaults__
+    HTTPConnection.__init__.__defaults__ = tuple(
+        UPLOAD_BLOCKSIZE if value == DEFAULT_BLOCKSIZE else value
+        for value in original_defaults
+    )
+    yield
+    HTTPConnection.__init__.__defaults__ = original_defaults
+
+@pytest.fixture
+def payload(request):
+    """무결성 테스트용 랜덤 데이터와 해시 (data, digest)
+
+    parametrize(..., indirect=True)로 파일 크기를 전달받고, 크기별로 한 번 생성한
+    데이터를 재시도/다른 테스트 클래스에서도 재사용합니다.
+    """
+    size = request.param
+    if size not in _PAYLOAD_CACHE:
+        data = os.urandom(size)
+        _PAYLOAD_CACHE[size] = (data, _digest(data))
+    return _PAYLOAD_CACHE[size]
+
+@pytest.fixture(scope="session")
+def new_hasher():
+    """다운로드 측 해시 객체 생성 함수 (payload와 같은 알고리즘)"""
+    return _new_hasher
+
+@pytest.fixture
+def exists_batch(s3_client):
+    """여러 객체의 존재 여부를 HEAD 요청으로 병렬 확인하는 함수 (bucket, keys -> {key: bool})"""
+    def exists(bucket, key):
+        try:
+            s3_client.head_object(Bucket=bucket, Key=key)
+            return True
+        except ClientError as e:
+            # NCP는 HEAD 요청 시 'NoSuchKey' 대신 '404'를 반환하므로 HTTP 상태 코드로 판단
+            if e.response['ResponseMetadata']['HTTPStatusCode'] == 404:
+                return False
+            raise
+    
+    def check(bucket, keys):
+        keys = list(keys)
+        if not keys:
+            return {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(keys), 16)) as executor:
+            return dict(zip(keys, executor.map(lambda key: exists(bucket, key), keys)))
+    
+    return check
+
+def pytest_addoption(parser):
+    """커스텀 명령행 옵션"""
+    parser.addoption(
+        "--skip-network",
+        action="store_true",
+        default=False,
+        help="NCP Object Storage에 실제 요청을 보내는 network 마커 테스트를 건너뜀"
+    )
+
+def pytest_configure(config):
+    """pytest 설정"""
+    config.addinivalue_line("markers", "network: NCP 인증 정보와 네트워크가 필요한 테스트")
+
+def pytest_collection_modifyitems(config, items):
+    """수집된 모든 테스트에 network 마커 적용
+
+    모든 테스트가 실제 NCP Object Storage에 요청을 보내므로 모듈마다 pytestmark를 두지 않고
+    여기서 한 번에 마킹합니다. --skip-network 지정 또는 NCP 인증 정보가 없으면
+    network 테스트를 픽스처 생성 전에 건너뜁니다.
+    """
+    if config.getoption("--skip-network"):
+        skip_network = pytest.mark.skip(reason="--skip-network 옵션으로 network 테스트 건너뜀")
+    elif not os.getenv('NCP_ACCESS_KEY') or not os.getenv('NCP_SECRET_KEY'):
+        skip_network = pytest.mark.skip(reason="NCP_ACCESS_KEY/NCP_SECRET_KEY 환경변수가 없어 network 테스트 건너뜀")
+    else:
+        skip_network = None
+    
+    for item in items:
+        item.add_marker(pytest.mark.network)
+        if skip_network is not None:
+            item.add_marker(skip_network)
@@ -0,0 +1,32 @@
+"""
+테스트 모듈 공통 헬퍼 (픽스처가 아닌 일반 함수)
+"""
+import concurrent.futures
+import os
+
+def xdist_worker_id():
+    """pytest-xdist 워커 ID (단독 실행 시 gw0)"""
+    return os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+
+def empty_bucket(s3_client, bucket_name):
+    """버킷의 모든 객체를 페이지(최대 1000개) 단위로 병렬 일괄 삭제"""
+    def delete_page(keys):
+        response = s3_client.delete_objects(
+            Bucket=bucket_name,
+            Delete={'Objects': [{'Key': key} for key in keys], 'Quiet': True}
+        )
+        # Quiet 모드에서도 키별 삭제 실패는 예외 없이 Errors 항목으로만 반환됨
+        errors = response.get('Errors')
+        if errors:
+            failed = ', '.join(f"{error['Key']} ({error.get('Code')})" for error in errors)
+            raise RuntimeError(f"{bucket_name} 버킷 객체 삭제 실패 {len(errors)}개: {failed}")
+    
+    paginator = s3_client.get_paginator('list_objects_v2')
+    pages = (
+        [obj['Key'] for obj in page['Contents']]
+        for page in paginator.paginate(Bucket=bucket_name)
+        if 'Contents' in page
+    )
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        # list()로 모든 삭제 결과를 소비해서 요청/키별 삭제 실패 시 예외가 전파되도록 함
+        list(executor.map(delete_page, pages))
@@ -1,25 +1,17 @@
 import pytest
-import boto3
 import time
+import uuid
 import hashlib
 from dotenv import load_dotenv
-import os
 
-load_dotenv()
+from ncp_test_utils import xdist_worker_id
 
-@pytest.fixture
-def s3_client():
-    return boto3.client(
-        's3',
-        endpoint_url=os.getenv('NCP_ENDPOINT_URL'),
-        aws_access_key_id=os.getenv('NCP_ACCESS_KEY'),
-        aws_secret_access_key=os.getenv('NCP_SECRET_KEY'),
-        region_name=os.getenv('NCP_REGION')
-    )
+load_dotenv()
 
-@pytest.fixture  
+@pytest.fixture(scope="session")
 def test_bucket(s3_client):
-    bucket_name = f"pytest-test-{int(time.time())}"
+    # xdist 워커 ID + UUID로 병렬 실행 시 버킷 이름 충돌 방지
+    bucket_name = f"pytest-test-{xdist_worker_id()}-{int(time.time())}-{uuid.uuid4().hex[:8]}"
     s3_client.create_bucket(Bucket=bucket_name)
     yield bucket_name
     
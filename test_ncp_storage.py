@@ -2,8 +2,6 @@
 NCP Object Storage API 자동화 테스트 - 포트폴리오 버전
 """
 import pytest
-import boto3
-import hashlib
 import os
 import time
 import logging
@@ -12,6 +10,8 @@ from datetime import datetime
 from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 
+from ncp_test_utils import empty_bucket, xdist_worker_id
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -42,25 +42,11 @@ class TestConfig:
 def test_config():
     return TestConfig()
 
-@pytest.fixture(scope="session")
-def s3_client(test_config):
-    """S3 클라이언트 픽스처"""
-    client = boto3.client(
-        's3',
-        endpoint_url=test_config.endpoint_url,
-        aws_access_key_id=test_config.access_key,
-        aws_secret_access_key=test_config.secret_key,
-        region_name=test_config.region_name
-    )
-    logger.info("NCP Object Storage 클라이언트 초기화 완료")
-    return client
-
 @pytest.fixture(scope="session")
 def test_bucket(s3_client, test_config):
-    """테스트용 버킷 생성/삭제 픽스처"""
-    import uuid
-    # UUID를 추가해서 고유한 버킷 이름 생성
-    bucket_name = f"{test_config.test_bucket_prefix}{int(time.time())}-{uuid.uuid4().hex[:8]}"
+    """테스트용 버킷 생성/삭제 픽스처 (xdist 워커별로 하나씩 생성)"""
+    # 워커 ID와 UUID를 추가해서 워커 간에 충돌하지 않는 고유한 버킷 이름 생성
+    bucket_name = f"{test_config.test_bucket_prefix}{xdist_worker_id()}-{int(time.time())}-{uuid.uuid4().hex[:8]}"
     
     try:
         s3_client.create_bucket(Bucket=bucket_name)
@@ -68,7 +54,7 @@ def test_bucket(s3_client, test_config):
     except ClientError as e:
         if e.response['Error']['Code'] == 'BucketAlreadyExists':
             # 기존 버킷이 있다면 삭제 후 재생성
-            bucket_name = f"{test_config.test_bucket_prefix}{int(time.time())}-{uuid.uuid4().hex[:8]}"
+            bucket_name = f"{test_config.test_bucket_prefix}{xdist_worker_id()}-{int(time.time())}-{uuid.uuid4().hex[:8]}"
             s3_client.create_bucket(Bucket=bucket_name)
         else:
             raise
@@ -77,10 +63,7 @@ def test_bucket(s3_client, test_config):
     
     # 정리
     try:
-        objects = s3_client.list_objects_v2(Bucket=bucket_name)
-        if 'Contents' in objects:
-            delete_objects = {'Objects': [{'Key': obj['Key']} for obj in objects['Contents']]}
-            s3_client.delete_objects(Bucket=bucket_name, Delete=delete_objects)
+        empty_bucket(s3_client, bucket_name)
         s3_client.delete_bucket(Bucket=bucket_name)
         logger.info(f"테스트 버킷 정리 완료: {bucket_name}")
     except Exception as e:
@@ -93,7 +76,7 @@ class TestBasicFunctionality:
         """버킷 생성, 조회, 삭제 테스트"""
         logger.info("버킷 기본 작업 테스트 시작")
         
-        bucket_name = f"{test_config.test_bucket_prefix}temp-{int(time.time())}"
+        bucket_name = f"{test_config.test_bucket_prefix}temp-{xdist_worker_id()}-{int(time.time())}-{uuid.uuid4().hex[:8]}"
         
         # 버킷 생성
         response = s3_client.create_bucket(Bucket=bucket_name)
@@ -129,11 +112,9 @@ class TestBasicFunctionality:
             ContentType='text/plain'
         )
         
-        # 객체 목록 조회
-        objects = s3_client.list_objects_v2(Bucket=test_bucket)
-        assert 'Contents' in objects
-        object_keys = [obj['Key'] for obj in objects['Contents']]
-        assert object_key in object_keys
+        # 객체 존재 확인 (버킷 전체 목록 조회 대신 HEAD 한 번으로 확인)
+        response = s3_client.head_object(Bucket=test_bucket, Key=object_key)
+        assert response['ResponseMetadata']['HTTPStatusCode'] == 200
         
         # 객체 다운로드
         response = s3_client.get_object(Bucket=test_bucket, Key=object_key)
@@ -143,20 +124,24 @@ class TestBasicFunctionality:
         # 객체 삭제
         s3_client.delete_object(Bucket=test_bucket, Key=object_key)
         
+        # 삭제 확인 (NCP는 HEAD 요청 시 'NoSuchKey' 대신 '404' 반환)
+        with pytest.raises(ClientError) as exc_info:
+            s3_client.head_object(Bucket=test_bucket, Key=object_key)
+        assert exc_info.value.response['Error']['Code'] in ['404', 'NoSuchKey']
+        
         logger.info("객체 CRUD 작업 테스트 완료")
 
 class TestDataIntegrity:
     """데이터 무결성 테스트"""
     
-    @pytest.mark.parametrize("file_size", [1024, 1024*1024])  # 1KB, 1MB
-    def test_file_integrity(self, s3_client, test_bucket, file_size):
+    @pytest.mark.parametrize("payload", [1024, 1024*1024, 5*1024*1024], indirect=True)  # 1KB, 1MB, 5MB
+    def test_file_integrity(self, s3_client, test_bucket, new_hasher, payload):
         """파일 무결성 테스트"""
+        # payload 픽스처에서 미리 생성한 랜덤 데이터/해시 재사용
+        test_data, original_digest = payload
+        file_size = len(test_data)
         logger.info(f"{file_size} bytes 파일 무결성 테스트 시작")
         
-        import random
-        test_data = bytes(random.getrandbits(8) for _ in range(file_size))
-        original_md5 = hashlib.md5(test_data).hexdigest()
-        
         object_key = f'integrity/test-{file_size}-bytes.dat'
         
         # 업로드 (ContentMD5 제거 - NCP 호환성 이슈로 인해)
@@ -166,13 +151,17 @@ class TestDataIntegrity:
             Body=test_data
         )
         
-        # 다운로드
+        # 다운로드 (1MB 청크 단위로 수신하면서 해시를 함께 계산)
         response = s3_client.get_object(Bucket=test_bucket, Key=object_key)
-        downloaded_data = response['Body'].read()
-        downloaded_md5 = hashlib.md5(downloaded_data).hexdigest()
+        hasher = new_hasher()
+        downloaded_data = bytearray()
+        for chunk in iter(lambda: response['Body'].read(1024 * 1024), b''):
+            hasher.update(chunk)
+            downloaded_data.extend(chunk)
+        downloaded_digest = hasher.hexdigest()
         
         # 무결성 검증
-        assert original_md5 == downloaded_md5
+        assert original_digest == downloaded_digest
         assert len(test_data) == len(downloaded_data)
         assert test_data == downloaded_data
         
@@ -194,6 +183,11 @@ class TestErrorHandling:
                 Body='test content'
             )
         assert exc_info.value.response['Error']['Code'] == 'NoSuchBucket'
+        
+        # 존재하지 않는 버킷의 객체 조회 시도
+        with pytest.raises(ClientError) as exc_info:
+            s3_client.get_object(Bucket=nonexistent_bucket, Key='test.txt')
+        assert exc_info.value.response['Error']['Code'] == 'NoSuchBucket'
         logger.info("예상된 NoSuchBucket 오류 확인")
     
     def test_nonexistent_object_operations(self, s3_client, test_bucket):
@@ -222,15 +216,17 @@ class TestErrorHandling:
 @pytest.fixture(scope="session", autouse=True)
 def test_session_setup():
     """테스트 세션 설정"""
+    # xdist 실행 시 세션 픽스처는 워커마다 실행되므로 워커 ID를 함께 기록
+    worker_id = xdist_worker_id()
     start_time = datetime.now()
-    logger.info("=== NCP Object Storage API 테스트 시작 ===")
+    logger.info(f"=== NCP Object Storage API 테스트 시작 [{worker_id}] ===")
     logger.info(f"테스트 시작 시간: {start_time}")
     
     yield
     
     end_time = datetime.now()
     duration = end_time - start_time
-    logger.info("=== NCP Object Storage API 테스트 완료 ===")
+    logger.info(f"=== NCP Object Storage API 테스트 완료 [{worker_id}] ===")
     logger.info(f"총 실행 시간: {duration}")
 
 if __name__ == "__main__":
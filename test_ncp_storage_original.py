@@ -1,28 +1,49 @@
 """
-NCP Object Storage API 자동화 테스트
+NCP Object Storage API 자동화 테스트 - 확장 테스트
 pytest 기반 테스트 스위트
 
+기본 기능/데이터 무결성/오류 처리 테스트는 test_ncp_storage.py로 통합되었고,
+이 파일에는 성능/보안/S3 호환성/멀티파트 테스트만 남아 있습니다.
+
 설치 필요 패키지:
 pip install pytest boto3 requests pytest-html pytest-xdist python-dotenv
 
 실행 방법:
 pytest test_ncp_storage.py -v --html=reports/report.html --self-contained-html
+
+병렬 실행 (pytest-xdist):
+pytest test_ncp_storage.py -n auto
 """
 
 import pytest
 import boto3
+import concurrent.futures
 import requests
-import hashlib
+import io
 import os
 import time
+import uuid
 from datetime import datetime, timedelta
 from botocore.exceptions import ClientError
 from botocore.client import Config
+from boto3.s3.transfer import TransferConfig
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+from ncp_test_utils import empty_bucket, xdist_worker_id
 
 # 환경 변수 로드
 load_dotenv()
 
+# 대용량 전송 설정: 16MB 파트로 요청 수/파트당 오버헤드를 줄이고, 임계값을 파트 크기와 같게 맞춰
+# 파트 1개짜리 멀티파트(생성/파트/완료 3회 요청)를 만들지 않음 (10MB 이하는 단일 PUT/GET)
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
+)
+
 class NCPObjectStorageConfig:
     """NCP Object Storage 설정"""
     def __init__(self):
@@ -40,22 +61,11 @@ def ncp_config():
     """NCP 설정 픽스처"""
     return NCPObjectStorageConfig()
 
-@pytest.fixture(scope="session")
-def s3_client(ncp_config):
-    """S3 클라이언트 픽스처"""
-    client = boto3.client(
-        's3',
-        endpoint_url=ncp_config.endpoint_url,
-        aws_access_key_id=ncp_config.access_key,
-        aws_secret_access_key=ncp_config.secret_key,
-        region_name=ncp_config.region_name
-    )
-    return client
-
 @pytest.fixture(scope="session")
 def test_bucket(s3_client, ncp_config):
     """테스트용 버킷 생성/삭제 픽스처"""
-    bucket_name = f"{ncp_config.test_bucket_prefix}{int(time.time())}"
+    # xdist 워커마다 세션 픽스처가 생성되므로 워커 ID + UUID로 이름 충돌 방지
+    bucket_name = f"{ncp_config.test_bucket_prefix}{xdist_worker_id()}-{int(time.time())}-{uuid.uuid4().hex[:8]}"
     
     # 버킷 생성
     s3_client.create_bucket(Bucket=bucket_name)
@@ -64,78 +74,18 @@ def test_bucket(s3_client, ncp_config):
     
     # 정리: 버킷 내 모든 객체 삭제 후 버킷 삭제
     try:
-        objects = s3_client.list_objects_v2(Bucket=bucket_name)
-        if 'Contents' in objects:
-            delete_objects = {'Objects': [{'Key': obj['Key']} for obj in objects['Contents']]}
-            s3_client.delete_objects(Bucket=bucket_name, Delete=delete_objects)
+        empty_bucket(s3_client, bucket_name)
         s3_client.delete_bucket(Bucket=bucket_name)
     except Exception as e:
         print(f"테스트 버킷 정리 중 오류: {e}")
 
-class TestBasicFunctionality:
-    """AUTO_001: 기본 기능 회귀 테스트"""
-    
-    def test_bucket_operations(self, s3_client, ncp_config):
-        """버킷 생성, 목록 조회, 삭제 테스트"""
-        bucket_name = f"{ncp_config.test_bucket_prefix}basic-{int(time.time())}"
-        
-        # 버킷 생성
-        response = s3_client.create_bucket(Bucket=bucket_name)
-        assert response['ResponseMetadata']['HTTPStatusCode'] == 200
-        
-        # 버킷 목록 조회
-        buckets = s3_client.list_buckets()
-        bucket_names = [bucket['Name'] for bucket in buckets['Buckets']]
-        assert bucket_name in bucket_names
-        
-        # 버킷 삭제
-        s3_client.delete_bucket(Bucket=bucket_name)
-        
-        # 삭제 확인
-        buckets = s3_client.list_buckets()
-        bucket_names = [bucket['Name'] for bucket in buckets['Buckets']]
-        assert bucket_name not in bucket_names
-
-    def test_object_crud_operations(self, s3_client, test_bucket):
-        """객체 CRUD 작업 테스트"""
-        object_key = 'test-files/sample.txt'
-        test_content = 'Hello NCP Object Storage!'
-        
-        # 객체 업로드
-        s3_client.put_object(
-            Bucket=test_bucket,
-            Key=object_key,
-            Body=test_content.encode('utf-8'),
-            ContentType='text/plain'
-        )
-        
-        # 객체 목록 조회
-        objects = s3_client.list_objects_v2(Bucket=test_bucket)
-        assert 'Contents' in objects
-        object_keys = [obj['Key'] for obj in objects['Contents']]
-        assert object_key in object_keys
-        
-        # 객체 다운로드
-        response = s3_client.get_object(Bucket=test_bucket, Key=object_key)
-        downloaded_content = response['Body'].read().decode('utf-8')
-        assert downloaded_content == test_content
-        
-        # 객체 삭제
-        s3_client.delete_object(Bucket=test_bucket, Key=object_key)
-        
-        # 삭제 확인
-        objects = s3_client.list_objects_v2(Bucket=test_bucket)
-        if 'Contents' in objects:
-            object_keys = [obj['Key'] for obj in objects['Contents']]
-            assert object_key not in object_keys
-
 class TestPerformanceBaseline:
     """AUTO_002: 업로드/다운로드 성능 기준선 테스트"""
     
     def create_test_file(self, size_mb):
         """테스트용 파일 생성"""
-        content = 'A' * (1024 * 1024 * size_mb)  # size_mb MB 파일
-        return content.encode('utf-8')
+        # bytes 반복은 str 생성 + encode 복사 없이 한 번에 할당
+        return b'A' * (1024 * 1024 * size_mb)  # size_mb MB 파일
     
     @pytest.mark.parametrize("file_size_mb", [1, 5, 10])  # 50MB는 비용 절약을 위해 10MB로 변경
     def test_upload_performance(self, s3_client, test_bucket, file_size_mb):
@@ -143,13 +93,15 @@ class TestPerformanceBaseline:
         object_key = f'performance/test-{file_size_mb}mb.dat'
         test_data = self.create_test_file(file_size_mb)
         
-        start_time = time.time()
-        s3_client.put_object(
+        # perf_counter: 시스템 시계 보정(NTP)의 영향을 받지 않는 고해상도 단조 타이머
+        start_time = time.perf_counter()
+        s3_client.upload_fileobj(
+            Fileobj=io.BytesIO(test_data),
             Bucket=test_bucket,
             Key=object_key,
-            Body=test_data
+            Config=TRANSFER_CONFIG
         )
-        upload_time = time.time() - start_time
+        upload_time = time.perf_counter() - start_time
         
         # 성능 기준: 1MB당 3초 이하
         expected_max_time = file_size_mb * 3
@@ -157,37 +109,54 @@ class TestPerformanceBaseline:
         
         print(f"{file_size_mb}MB 파일 업로드 시간: {upload_time:.2f}초")
     
-    def test_concurrent_uploads(self, s3_client, test_bucket):
+    def test_concurrent_uploads(self, s3_client, test_bucket, exists_batch):
         """동시 업로드 테스트"""
-        import concurrent.futures
-        import threading
+        # 업로드 루프에서 boto3 요청 직렬화/이벤트 훅/파라미터 검증을 건너뛰도록
+        # PUT 요청을 미리 서명해 두고, 스레드에서는 서명된 URL로 본문만 전송
+        presigned_urls = {
+            file_index: s3_client.generate_presigned_url(
+                'put_object',
+                Params={'Bucket': test_bucket, 'Key': f'concurrent/file-{file_index}.txt'},
+                ExpiresIn=300
+            )
+            for file_index in range(10)
+        }
+        http = requests.Session()
+        http.mount('https://', HTTPAdapter(pool_maxsize=16))
         
         def upload_file(file_index):
-            object_key = f'concurrent/file-{file_index}.txt'
             content = f'Concurrent test file {file_index}'
             try:
-                start_time = time.time()
-                s3_client.put_object(
-                    Bucket=test_bucket,
-                    Key=object_key,
-                    Body=content.encode('utf-8')
-                )
-                return time.time() - start_time
+                start_time = time.perf_counter()
+                response = http.put(presigned_urls[file_index], data=content.encode('utf-8'), timeout=30)
+                response.raise_for_status()
+                return time.perf_counter() - start_time
             except Exception as e:
                 return f"Error: {e}"
         
-        # 10개 파일 동시 업로드
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+        # 10개 파일 동시 업로드 (모든 업로드를 한 번에 병렬 실행)
+        batch_start_time = time.perf_counter()
+        with http, concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
             futures = [executor.submit(upload_file, i) for i in range(10)]
             results = [future.result() for future in concurrent.futures.as_completed(futures)]
+        batch_duration = time.perf_counter() - batch_start_time
         
         # 모든 업로드가 성공했는지 확인
         successful_uploads = [r for r in results if isinstance(r, float)]
         assert len(successful_uploads) == 10, "모든 동시 업로드가 성공해야 함"
         
+        # 업로드된 객체 존재 여부를 병렬 HEAD로 한 번에 확인
+        existence = exists_batch(test_bucket, [f'concurrent/file-{i}.txt' for i in range(10)])
+        assert all(existence.values()), f"업로드되지 않은 객체: {[k for k, v in existence.items() if not v]}"
+        
         # 평균 업로드 시간이 10초 이하인지 확인
         avg_time = sum(successful_uploads) / len(successful_uploads)
         assert avg_time < 10, f"평균 업로드 시간 {avg_time:.2f}초가 기준 10초를 초과"
+        
+        # 실제로 병렬 실행되었는지 확인: 전체 소요 시간이 개별 업로드 시간 합(순차 실행 시간)의 절반 미만
+        serial_time = sum(successful_uploads)
+        assert batch_duration < serial_time * 0.5, \
+            f"동시 업로드 소요 시간 {batch_duration:.2f}초가 순차 실행 예상 시간 {serial_time:.2f}초의 50% 이상"
 
 class TestSecurityAndAuth:
     """AUTO_003: 인증 및 권한 제어 테스트"""
@@ -199,7 +168,9 @@ class TestSecurityAndAuth:
             endpoint_url=ncp_config.endpoint_url,
             aws_access_key_id='INVALID_KEY',
             aws_secret_access_key='invalid_secret',
-            region_name=ncp_config.region_name
+            region_name=ncp_config.region_name,
+            # 인증 실패는 재시도해도 결과가 같으므로 재시도/백오프 없이 즉시 실패 (total_max_attempts=1: 첫 요청만 전송)
+            config=Config(retries={'total_max_attempts': 1}, connect_timeout=3, read_timeout=3)
         )
         
         with pytest.raises(ClientError) as exc_info:
@@ -237,44 +208,6 @@ class TestSecurityAndAuth:
                         if grant.get('Grantee', {}).get('Type') == 'Group']
         assert len(public_grants) > 0, "Public-read ACL이 적용되어야 함"
 
-class TestDataIntegrity:
-    """AUTO_005: 업로드/다운로드 무결성 테스트"""
-    
-    def calculate_md5(self, data):
-        """MD5 해시 계산"""
-        if isinstance(data, str):
-            data = data.encode('utf-8')
-        return hashlib.md5(data).hexdigest()
-    
-    @pytest.mark.parametrize("file_size", [1024, 1024*1024, 5*1024*1024])  # 1KB, 1MB, 5MB (10MB에서 5MB로 변경)
-    def test_file_integrity(self, s3_client, test_bucket, file_size):
-        """파일 무결성 테스트"""
-        import random
-        import base64
-        
-        # 랜덤 테스트 데이터 생성
-        test_data = bytes(random.getrandbits(8) for _ in range(file_size))
-        original_md5 = hashlib.md5(test_data).hexdigest()
-        
-        object_key = f'integrity/test-{file_size}-bytes.dat'
-        
-        # 업로드 (ContentMD5 제거 - NCP에서 호환성 문제 발생)
-        s3_client.put_object(
-            Bucket=test_bucket,
-            Key=object_key,
-            Body=test_data
-        )
-        
-        # 다운로드
-        response = s3_client.get_object(Bucket=test_bucket, Key=object_key)
-        downloaded_data = response['Body'].read()
-        downloaded_md5 = hashlib.md5(downloaded_data).hexdigest()
-        
-        # 무결성 검증
-        assert original_md5 == downloaded_md5, f"MD5 불일치: 원본={original_md5}, 다운로드={downloaded_md5}"
-        assert len(test_data) == len(downloaded_data), "파일 크기 불일치"
-        assert test_data == downloaded_data, "파일 내용 불일치"
-
 class TestS3Compatibility:
     """AUTO_004: S3 호환성 검증 테스트"""
     
@@ -307,112 +240,62 @@ class TestS3Compatibility:
         assert partial_content == 'S3 co'
         assert response['ResponseMetadata']['HTTPStatusCode'] == 206  # Partial Content
 
-class TestErrorHandling:
-    """AUTO_013: 오류 상황 처리 테스트"""
-    
-    def test_nonexistent_bucket_operations(self, s3_client):
-        """존재하지 않는 버킷 작업 테스트"""
-        nonexistent_bucket = 'nonexistent-bucket-12345'
-        
-        # 존재하지 않는 버킷에 객체 업로드 시도
-        with pytest.raises(ClientError) as exc_info:
-            s3_client.put_object(
-                Bucket=nonexistent_bucket,
-                Key='test.txt',
-                Body='test content'
-            )
-        assert exc_info.value.response['Error']['Code'] == 'NoSuchBucket'
-        
-        # 존재하지 않는 버킷의 객체 조회 시도
-        with pytest.raises(ClientError) as exc_info:
-            s3_client.get_object(Bucket=nonexistent_bucket, Key='test.txt')
-        assert exc_info.value.response['Error']['Code'] == 'NoSuchBucket'
-    
-    def test_nonexistent_object_operations(self, s3_client, test_bucket):
-        """존재하지 않는 객체 작업 테스트"""
-        nonexistent_key = 'nonexistent/file.txt'
-        
-        # 존재하지 않는 객체 다운로드 시도
-        with pytest.raises(ClientError) as exc_info:
-            s3_client.get_object(Bucket=test_bucket, Key=nonexistent_key)
-        assert exc_info.value.response['Error']['Code'] == 'NoSuchKey'
-        
-        # 존재하지 않는 객체 메타데이터 조회 시도
-        with pytest.raises(ClientError) as exc_info:
-            s3_client.head_object(Bucket=test_bucket, Key=nonexistent_key)
-        assert exc_info.value.response['Error']['Code'] == 'NoSuchKey'
-
 class TestMultipartUpload:
     """AUTO_010: 멀티파트 업로드 테스트"""
     
-    def test_multipart_upload_workflow(self, s3_client, test_bucket):
+    # 파트 크기가 5MB -> 16MB 이상일 때 파트당 요청/서명 오버헤드가 크게 줄어듦
+    @pytest.mark.parametrize("part_mb", [16, 64])
+    def test_multipart_upload_workflow(self, s3_client, test_bucket, part_mb):
         """멀티파트 업로드 전체 워크플로우"""
-        object_key = 'multipart/large-file.dat'
-        
-        # 10MB 테스트 데이터 생성 (5MB씩 2파트)
-        part_size = 5 * 1024 * 1024  # 5MB
-        part1_data = b'A' * part_size
-        part2_data = b'B' * part_size
+        object_key = f'multipart/large-file-{part_mb}mb-part.dat'
+        
+        # 2파트 테스트 데이터 생성 (part_mb MB 파트 + 1MB 마지막 파트, NCP 최소 파트 크기 5MB는 마지막 파트 제외)
+        # bytes로 생성해야 io.BytesIO가 버퍼를 복사하지 않고 공유함 (bytearray는 전체 복사)
+        part_size = part_mb * 1024 * 1024
+        last_part_size = 1024 * 1024
+        expected_data = b'A' * part_size + b'B' * last_part_size
+        
+        # TransferConfig로 파트 분할/병렬 업로드/실패 시 abort를 boto3에 위임
+        transfer_config = TransferConfig(
+            multipart_threshold=part_size,
+            multipart_chunksize=part_size,
+            max_concurrency=10,
+            use_threads=True
+        )
+        s3_client.upload_fileobj(
+            Fileobj=io.BytesIO(expected_data),
+            Bucket=test_bucket,
+            Key=object_key,
+            Config=transfer_config
+        )
         
-        # 멀티파트 업로드 시작
-        response = s3_client.create_multipart_upload(Bucket=test_bucket, Key=object_key)
-        upload_id = response['UploadId']
+        # 업로드된 파일 검증 (16MB 이상이므로 16MB 바이트 범위 GET을 병렬로 받아서 조립)
+        buffer = io.BytesIO()
+        s3_client.download_fileobj(
+            Bucket=test_bucket,
+            Key=object_key,
+            Fileobj=buffer,
+            Config=TRANSFER_CONFIG
+        )
+        downloaded_data = buffer.getvalue()
         
-        parts = []
+        assert len(downloaded_data) == len(expected_data)
+        assert downloaded_data == expected_data
         
-        try:
-            # 파트 1 업로드
-            response1 = s3_client.upload_part(
-                Bucket=test_bucket,
-                Key=object_key,
-                PartNumber=1,
-                UploadId=upload_id,
-                Body=part1_data
-            )
-            parts.append({'ETag': response1['ETag'], 'PartNumber': 1})
-            
-            # 파트 2 업로드
-            response2 = s3_client.upload_part(
-                Bucket=test_bucket,
-                Key=object_key,
-                PartNumber=2,
-                UploadId=upload_id,
-                Body=part2_data
-            )
-            parts.append({'ETag': response2['ETag'], 'PartNumber': 2})
-            
-            # 멀티파트 업로드 완성
-            s3_client.complete_multipart_upload(
-                Bucket=test_bucket,
-                Key=object_key,
-                UploadId=upload_id,
-                MultipartUpload={'Parts': parts}
-            )
-            
-            # 업로드된 파일 검증
-            response = s3_client.get_object(Bucket=test_bucket, Key=object_key)
-            downloaded_data = response['Body'].read()
-            
-            expected_data = part1_data + part2_data
-            assert len(downloaded_data) == len(expected_data)
-            assert downloaded_data == expected_data
-            
-        except Exception as e:
-            # 실패 시 멀티파트 업로드 중단
-            s3_client.abort_multipart_upload(
-                Bucket=test_bucket,
-                Key=object_key,
-                UploadId=upload_id
-            )
-            raise e
+        # 멀티파트로 업로드되었는지 확인: 멀티파트 객체의 ETag는 '"<hash>-<파트 수>"' 형식
+        etag = s3_client.head_object(Bucket=test_bucket, Key=object_key)['ETag'].strip('"')
+        assert '-' in etag, f"멀티파트 업로드가 사용되지 않음 (ETag={etag})"
+        parts_uploaded = int(etag.rsplit('-', 1)[1])
+        assert parts_uploaded >= 2, f"업로드된 파트 수 {parts_uploaded}개 (기대: 2개 이상)"
 
 # 테스트 실행을 위한 conftest.py 설정
 @pytest.fixture(scope="session", autouse=True)
 def test_session_setup():
     """테스트 세션 설정"""
-    print("\n=== NCP Object Storage API 테스트 시작 ===")
+    worker_id = xdist_worker_id()
+    print(f"\n=== NCP Object Storage API 테스트 시작 [{worker_id}] ===")
     yield
-    print("\n=== NCP Object Storage API 테스트 완료 ===")
+    print(f"\n=== NCP Object Storage API 테스트 완료 [{worker_id}] ===")
 
 # 커스텀 마커 정의
 def pytest_configure(config):